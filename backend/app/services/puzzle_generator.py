@@ -30,7 +30,8 @@ import logging
 import random
 import time
 from collections import Counter
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from backend.app.constants.colors import ColorToken
 from backend.app.constants.color_labels import Language
@@ -40,6 +41,150 @@ from backend.app.services.distribution_validator import DistributionValidator
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _adjacency_table(
+    grid_size: int, cell_count: Optional[int] = None
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the orthogonal neighbor indices for the cells of a square grid.
+
+    Computed once per grid size and cell count; entry i lists the neighbors
+    of flat index i in up, down, left, right order. Rows past the last grid
+    row get no down neighbor, matching the row/column bounds of the grid.
+
+    Args:
+        grid_size: The dimension of the square grid.
+        cell_count: Number of entries to build (default: full grid).
+
+    Returns:
+        Tuple indexed by flat position, each holding up to 4 neighbor indices.
+    """
+    if cell_count is None:
+        cell_count = grid_size * grid_size
+
+    # Offsets for up, down, left, right; bit k of a boundary mask enables offsets[k]
+    offsets = (-grid_size, grid_size, -1, 1)
+    offsets_by_mask = tuple(
+        tuple(offsets[bit] for bit in range(4) if mask >> bit & 1)
+        for mask in range(16)
+    )
+
+    table = []
+    for flat_index in range(cell_count):
+        row, col = divmod(flat_index, grid_size)
+        mask = (
+            (row > 0)
+            | (row < grid_size - 1) << 1
+            | (col > 0) << 2
+            | (col < grid_size - 1) << 3
+        )
+        table.append(tuple(flat_index + offset for offset in offsets_by_mask[mask]))
+    return tuple(table)
+
+
+@lru_cache(maxsize=8)
+def _bounded_adjacency(grid_size: int, cell_count: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Adjacency table specialized to a grid holding cell_count cells.
+
+    Neighbor indices at or beyond cell_count are dropped ahead of time, so
+    the interference kernel needs no per-neighbor bounds check. cell_count
+    may be smaller or larger than grid_size ** 2.
+
+    Args:
+        grid_size: The dimension of the square grid.
+        cell_count: Number of cells actually present.
+
+    Returns:
+        Tuple indexed by flat position, each holding in-range neighbor indices.
+    """
+    return tuple(
+        tuple(adj_idx for adj_idx in neighbors if adj_idx < cell_count)
+        for neighbors in _adjacency_table(grid_size, cell_count)
+    )
+
+
+@lru_cache(maxsize=8)
+def _edge_list(
+    grid_size: int, cell_count: Optional[int] = None
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    List each orthogonally adjacent pair of a square grid exactly once.
+
+    Args:
+        grid_size: The dimension of the square grid.
+        cell_count: Number of cells actually present (default: full grid).
+                    Pairs reaching beyond it are omitted.
+
+    Returns:
+        Tuple of (i, j) index pairs with i < j, in ascending order of i.
+    """
+    if cell_count is None:
+        cell_count = grid_size * grid_size
+    return tuple(
+        (idx, adj_idx)
+        for idx, neighbors in enumerate(_bounded_adjacency(grid_size, cell_count))
+        for adj_idx in neighbors
+        if adj_idx > idx
+    )
+
+
+def _grid_interference(
+    words: List[ColorToken],
+    inks: List[ColorToken],
+    edges: Tuple[Tuple[int, int], ...],
+) -> int:
+    """
+    Sum interference over a list of adjacent pairs.
+
+    Args:
+        words: Word token of each cell, in flat grid order.
+        inks: Ink color of each cell, in flat grid order.
+        edges: Pairs from _edge_list() for the grid and cell count.
+
+    Returns:
+        Total interference; each pair contributes up to 2.
+    """
+    total = 0
+    for idx, adj_idx in edges:
+        total += (inks[idx] is words[adj_idx]) + (inks[adj_idx] is words[idx])
+    return total
+
+
+def _cell_interference(
+    words: List[ColorToken],
+    inks: List[ColorToken],
+    idx: int,
+    adjacency: Tuple[Tuple[int, ...], ...],
+) -> int:
+    """
+    Count interference pairs for one cell against a prebuilt adjacency table.
+
+    Works on parallel word/ink lists rather than PuzzleCell objects so the
+    optimizer's swap search reads plain list slots. Module-level so it is
+    called directly, without method dispatch or a per-call adjacency lookup.
+    ColorToken members are singletons, so tokens are compared by identity.
+
+    Args:
+        words: Word token of each cell, in flat grid order.
+        inks: Ink color of each cell, in flat grid order.
+        idx: Index of the cell to check.
+        adjacency: Table from _bounded_adjacency() for the grid and cell count.
+
+    Returns:
+        Count of interference relationships for this cell.
+    """
+    ink = inks[idx]
+    word = words[idx]
+
+    count = 0
+    for adj_idx in adjacency[idx]:
+        # Each direction counts on its own: my ink vs neighbor's word,
+        # then neighbor's ink vs my word
+        count += (ink is words[adj_idx]) + (inks[adj_idx] is word)
+    return count
+
+
 class PuzzleGenerator:
     """
     Generator for 8x8 Stroop interference puzzle grids.
@@ -220,11 +365,7 @@ class PuzzleGenerator:
         Returns:
             Dictionary mapping ColorToken to occurrence count.
         """
-        ink_colors = []
-        for row in cells_2d:
-            for cell in row:
-                ink_colors.append(cell.ink_color)
-        return Counter(ink_colors)
+        return Counter(cell.ink_color for row in cells_2d for cell in row)
 
     def _create_ink_distribution(self) -> List[ColorToken]:
         """
@@ -279,7 +420,7 @@ class PuzzleGenerator:
 
         return cells
 
-    def _get_adjacent_indices(self, flat_index: int, grid_size: int) -> List[int]:
+    def _get_adjacent_indices(self, flat_index: int, grid_size: int) -> Tuple[int, ...]:
         """
         Get orthogonally adjacent indices for a flat array position.
 
@@ -288,22 +429,17 @@ class PuzzleGenerator:
             grid_size: The dimension of the square grid.
 
         Returns:
-            List of valid adjacent indices (up to 4: up, down, left, right).
-        """
-        row = flat_index // grid_size
-        col = flat_index % grid_size
-        adjacent = []
-
-        if row > 0:
-            adjacent.append(flat_index - grid_size)
-        if row < grid_size - 1:
-            adjacent.append(flat_index + grid_size)
-        if col > 0:
-            adjacent.append(flat_index - 1)
-        if col < grid_size - 1:
-            adjacent.append(flat_index + 1)
+            Tuple of valid adjacent indices (up to 4: up, down, left, right).
 
-        return adjacent
+        Raises:
+            ValueError: If flat_index is negative.
+        """
+        if flat_index < 0:
+            raise ValueError(f"flat_index must be non-negative, got {flat_index}")
+        table = _adjacency_table(grid_size)
+        if flat_index >= len(table):
+            table = _adjacency_table(grid_size, flat_index + 1)
+        return table[flat_index]
 
     def _interference_at(
         self, cells: List[PuzzleCell], idx: int, grid_size: int
@@ -323,19 +459,37 @@ class PuzzleGenerator:
         Returns:
             Count of interference relationships for this cell.
         """
-        count = 0
         cell = cells[idx]
-        for adj_idx in self._get_adjacent_indices(idx, grid_size):
-            if adj_idx < len(cells):
-                adj_cell = cells[adj_idx]
-                # My ink matches neighbor's word
-                if cell.ink_color == adj_cell.word:
-                    count += 1
-                # Neighbor's ink matches my word
-                if adj_cell.ink_color == cell.word:
-                    count += 1
+        word = cell.word
+        ink = cell.ink_color
+        count = 0
+        for adj_idx in _bounded_adjacency(grid_size, len(cells))[idx]:
+            neighbor = cells[adj_idx]
+            # Each direction counts on its own: my ink vs neighbor's word,
+            # then neighbor's ink vs my word
+            count += (ink is neighbor.word) + (neighbor.ink_color is word)
         return count
 
+    def _total_interference(self, cells: List[PuzzleCell], grid_size: int) -> int:
+        """
+        Count interference across every adjacent pair in the grid.
+
+        Each unordered neighbor pair from _edge_list() is visited once and
+        contributes up to 2: one for each direction of ink/word matching.
+        Words and inks are pulled into flat lists first so the pair scan
+        avoids attribute lookups.
+
+        Args:
+            cells: Flat list of puzzle cells.
+            grid_size: The dimension of the square grid.
+
+        Returns:
+            Total interference count for the grid.
+        """
+        words = [cell.word for cell in cells]
+        inks = [cell.ink_color for cell in cells]
+        return _grid_interference(words, inks, _edge_list(grid_size, len(cells)))
+
     def _optimize_stroop_interference(
         self,
         cells: List[PuzzleCell],
@@ -356,34 +510,48 @@ class PuzzleGenerator:
         Returns:
             Optimized list of cells (new list, original unchanged).
         """
-        cells = list(cells)  # Copy to avoid mutating original
+        # Search on parallel word/ink lists; order tracks which original
+        # cell sits in each slot so cells are only rebuilt once at the end.
+        words = [cell.word for cell in cells]
+        inks = [cell.ink_color for cell in cells]
+        order = list(range(len(cells)))
+        adjacency = _bounded_adjacency(grid_size, len(cells))
+
+        # Every pair already interferes both ways: no swap can improve on it
+        edges = _edge_list(grid_size, len(cells))
+        if _grid_interference(words, inks, edges) == 2 * len(edges):
+            return list(cells)
+
+        randint = self._rng.randint
+        last_index = len(cells) - 1
+        # Sample random pairs to check (not exhaustive for performance)
+        pairs_to_check = min(100, len(cells) * 2)
 
         for _ in range(max_swaps):
             best_swap = None
             best_gain = 0
 
-            # Sample random pairs to check (not exhaustive for performance)
-            pairs_to_check = min(100, len(cells) * 2)
-
             for _ in range(pairs_to_check):
-                i = self._rng.randint(0, len(cells) - 1)
-                j = self._rng.randint(0, len(cells) - 1)
+                i = randint(0, last_index)
+                j = randint(0, last_index)
                 if i == j:
                     continue
 
                 # Calculate current interference contribution
                 current = (
-                    self._interference_at(cells, i, grid_size)
-                    + self._interference_at(cells, j, grid_size)
+                    _cell_interference(words, inks, i, adjacency)
+                    + _cell_interference(words, inks, j, adjacency)
                 )
 
                 # Swap and calculate new interference
-                cells[i], cells[j] = cells[j], cells[i]
+                words[i], words[j] = words[j], words[i]
+                inks[i], inks[j] = inks[j], inks[i]
                 swapped = (
-                    self._interference_at(cells, i, grid_size)
-                    + self._interference_at(cells, j, grid_size)
+                    _cell_interference(words, inks, i, adjacency)
+                    + _cell_interference(words, inks, j, adjacency)
                 )
-                cells[i], cells[j] = cells[j], cells[i]  # Swap back
+                words[i], words[j] = words[j], words[i]  # Swap back
+                inks[i], inks[j] = inks[j], inks[i]
 
                 gain = swapped - current
                 if gain > best_gain:
@@ -392,11 +560,13 @@ class PuzzleGenerator:
 
             if best_swap and best_gain > 0:
                 i, j = best_swap
-                cells[i], cells[j] = cells[j], cells[i]
+                words[i], words[j] = words[j], words[i]
+                inks[i], inks[j] = inks[j], inks[i]
+                order[i], order[j] = order[j], order[i]
             else:
                 break  # No improving swaps found
 
-        return cells
+        return [cells[k] for k in order]
 
     def _reshape_to_grid(
         self, cells_flat: List[PuzzleCell]
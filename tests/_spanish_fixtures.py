@@ -0,0 +1,19 @@
+"""
+Expected Spanish-language constants shared by the Spanish test modules.
+"""
+
+# Expected Spanish translations for color labels (accessible palette)
+EXPECTED_SPANISH_LABELS = {
+    "BLACK": "Negro",
+    "BROWN": "Cafe",
+    "PURPLE": "Morado",
+    "BLUE": "Azul",
+    "GRAY": "Gris",
+    "PINK": "Rosa",
+    "ORANGE": "Naranja",
+    "YELLOW": "Amarillo",
+}
+
+EXPECTED_COLOR_TOKENS = frozenset(
+    {"BLACK", "BROWN", "PURPLE", "BLUE", "GRAY", "PINK", "ORANGE", "YELLOW"}
+)
@@ -2,28 +2,55 @@
 Shared pytest fixtures and utilities for ColorFocus tests.
 """
 
+import re
+
 import pytest
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+# orjson parses bytes directly and is faster when present; stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 PROJECT_ROOT = Path(__file__).parent.parent
 PUZZLE_HTML_PATH = PROJECT_ROOT / "frontend" / "puzzle.html"
 PUZZLE_CSS_PATH = PROJECT_ROOT / "frontend" / "styles" / "puzzle.css"
 MODULES_DIR = PROJECT_ROOT / "frontend" / "src" / "modules"
+COLOR_LABELS_JSON_PATH = PROJECT_ROOT / "shared" / "color_labels.json"
+UI_TEXT_JSON_PATH = PROJECT_ROOT / "shared" / "ui_text.json"
 
+# Language keys used throughout the shared JSON, in Language enum order.
+# The tuple is for iteration and parametrization, the set for membership checks.
+SUPPORTED_LANGUAGES = ("zh-TW", "english", "vietnamese", "spanish")
+SUPPORTED_LANGUAGES_SET = frozenset(SUPPORTED_LANGUAGES)
 
-@pytest.fixture
+# Whitespace around colons, collapsed so "key: value" and "key:value" compare equal
+_COLON_SPACE_RE = re.compile(r"\s*:\s*")
+
+# Matches "name: {" and "name = {" object-literal headers in JS source
+_BLOCK_HEADER_RE = re.compile(r"(\w+)\s*[:=]\s*\{")
+
+
+@pytest.fixture(scope="session")
 def puzzle_html() -> str:
     """Load the puzzle.html file content."""
-    with open(PUZZLE_HTML_PATH, "r", encoding="utf-8") as f:
-        return f.read()
+    return load_puzzle_html()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def puzzle_html_bytes() -> bytes:
+    """Load puzzle.html as undecoded bytes for ASCII substring checks."""
+    return load_puzzle_html_bytes()
+
+
+@pytest.fixture(scope="session")
 def puzzle_css() -> str:
     """Load the puzzle.css file content."""
-    with open(PUZZLE_CSS_PATH, "r", encoding="utf-8") as f:
-        return f.read()
+    return load_puzzle_css()
 
 
 @pytest.fixture
@@ -36,14 +63,30 @@ def puzzle_html_and_css(puzzle_html, puzzle_css) -> str:
     return puzzle_html + "\n" + puzzle_css
 
 
+@lru_cache(maxsize=1)
 def load_puzzle_html() -> str:
-    """Load the puzzle.html file (utility function for non-fixture use)."""
-    with open(PUZZLE_HTML_PATH, "r", encoding="utf-8") as f:
-        return f.read()
+    """
+    Load the puzzle.html file (utility function for non-fixture use).
+    Decoded from the cached bytes, so the file is read once per test session.
+    """
+    return load_puzzle_html_bytes().decode("utf-8")
 
 
+@lru_cache(maxsize=1)
+def load_puzzle_html_bytes() -> bytes:
+    """
+    Load puzzle.html as raw bytes, skipping UTF-8 decoding.
+    For ASCII substring checks; cached so the file is read once per session.
+    """
+    return PUZZLE_HTML_PATH.read_bytes()
+
+
+@lru_cache(maxsize=1)
 def load_puzzle_css() -> str:
-    """Load the puzzle.css file (utility function for non-fixture use)."""
+    """
+    Load the puzzle.css file (utility function for non-fixture use).
+    Cached so the file is read once per test session.
+    """
     with open(PUZZLE_CSS_PATH, "r", encoding="utf-8") as f:
         return f.read()
 
@@ -55,10 +98,11 @@ def load_puzzle_html_and_css() -> str:
     return load_puzzle_html() + "\n" + load_puzzle_css()
 
 
+@lru_cache(maxsize=1)
 def load_puzzle_js() -> str:
     """
     Load all JavaScript module files (utility function for non-fixture use).
-    Returns combined content of all JS modules.
+    Returns combined content of all JS modules, cached per test session.
     """
     js_content = []
     for js_file in MODULES_DIR.glob("*.js"):
@@ -75,7 +119,7 @@ def load_puzzle_html_and_js() -> str:
     return load_puzzle_html() + "\n" + load_puzzle_js()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def puzzle_js() -> str:
     """Load all JavaScript module content."""
     return load_puzzle_js()
@@ -85,3 +129,126 @@ def puzzle_js() -> str:
 def puzzle_html_and_js(puzzle_html) -> str:
     """Return combined HTML and JS content."""
     return puzzle_html + "\n" + load_puzzle_js()
+
+
+def _freeze(value):
+    """Return value with every nested dict wrapped in a read-only MappingProxyType."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@lru_cache(maxsize=1)
+def load_color_labels() -> MappingProxyType:
+    """
+    Parse shared/color_labels.json (utility function for non-fixture use).
+    Cached and frozen at every level since every caller shares the same object.
+    """
+    return _freeze(_json_loads(COLOR_LABELS_JSON_PATH.read_bytes()))
+
+
+@lru_cache(maxsize=1)
+def load_ui_text() -> MappingProxyType:
+    """
+    Parse shared/ui_text.json (utility function for non-fixture use).
+    Cached and frozen at every level since every caller shares the same object.
+    """
+    return _freeze(_json_loads(UI_TEXT_JSON_PATH.read_bytes()))
+
+
+@pytest.fixture(scope="session")
+def color_labels() -> MappingProxyType:
+    """Parsed shared/color_labels.json, shared across the session."""
+    return load_color_labels()
+
+
+@pytest.fixture(scope="session")
+def ui_text() -> MappingProxyType:
+    """Parsed shared/ui_text.json, shared across the session."""
+    return load_ui_text()
+
+
+def find_matching_brace(text: str, open_idx: int) -> int:
+    """
+    Return the index of the brace closing the one at open_idx, or -1.
+
+    Jumps between brace positions with str.find instead of walking the
+    text one character at a time. The next "{" position is only searched
+    again once the scan has moved past it.
+    """
+    depth = 1
+    idx = open_idx + 1
+    next_open = text.find("{", idx)
+    while True:
+        next_close = text.find("}", idx)
+        if next_close == -1:
+            return -1
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            idx = next_open + 1
+            next_open = text.find("{", idx)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close
+            idx = next_close + 1
+
+
+def extract_block(text: str, header_re: re.Pattern) -> str:
+    """
+    Return the brace-balanced block following the first header_re match.
+
+    header_re must end on the opening brace. The block is found with a linear
+    brace scan rather than a [^}]+ regex, so nested braces cannot cause
+    backtracking. Returns "" when the header or the closing brace is missing.
+    """
+    match = header_re.search(text)
+    if not match:
+        return ""
+    open_idx = match.end() - 1
+    close_idx = find_matching_brace(text, open_idx)
+    if close_idx == -1:
+        return ""
+    return text[open_idx:close_idx + 1]
+
+
+def build_block_index(text: str) -> dict:
+    """
+    Map each object-literal identifier to its first brace-balanced block.
+
+    One regex pass finds every "name: {" / "name = {" header; the block text
+    (including braces) is recorded for the first occurrence of each name.
+    """
+    index = {}
+    for match in _BLOCK_HEADER_RE.finditer(text):
+        name = match.group(1)
+        if name in index:
+            continue
+        open_idx = match.end() - 1
+        close_idx = find_matching_brace(text, open_idx)
+        if close_idx != -1:
+            index[name] = text[open_idx:close_idx + 1]
+    return index
+
+
+def collapse_colon_space(text: str) -> str:
+    """Remove whitespace around colons so one needle form matches both spellings."""
+    return _COLON_SPACE_RE.sub(":", text)
+
+
+@pytest.fixture(scope="session")
+def puzzle_index() -> dict:
+    """Identifier -> object-literal block index of the JS modules."""
+    return build_block_index(load_puzzle_js())
+
+
+@pytest.fixture(scope="session")
+def puzzle_js_compact() -> str:
+    """JS module content with whitespace around colons collapsed."""
+    return collapse_colon_space(load_puzzle_js())
+
+
+@pytest.fixture(scope="session")
+def puzzle_css_compact() -> str:
+    """puzzle.css content with whitespace around colons collapsed."""
+    return collapse_colon_space(load_puzzle_css())
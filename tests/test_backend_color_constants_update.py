@@ -13,6 +13,8 @@ Part of Task Group 2: Python Constants Update
 import re
 from pathlib import Path
 
+from backend.app.constants.colors import COLORS, ColorToken, _load_colors_from_json
+
 
 # Expected new color tokens for accessible palette
 NEW_PALETTE_TOKENS = ["BLACK", "BROWN", "PURPLE", "BLUE", "GRAY", "PINK", "ORANGE", "YELLOW"]
@@ -41,14 +43,10 @@ class TestColorTokenEnumNewPalette:
 
     def test_color_token_has_exactly_8_members(self):
         """Test that ColorToken enum has exactly 8 members."""
-        from backend.app.constants.colors import ColorToken
-
         assert len(ColorToken) == 8, f"Expected 8 ColorToken values, got {len(ColorToken)}"
 
     def test_color_token_contains_all_new_palette_tokens(self):
         """Test that ColorToken enum has all new accessible palette tokens."""
-        from backend.app.constants.colors import ColorToken
-
         enum_values = [token.value for token in ColorToken]
 
         for token_name in NEW_PALETTE_TOKENS:
@@ -60,8 +58,6 @@ class TestOldTokensRemoved:
 
     def test_old_tokens_not_in_color_token_enum(self):
         """Test that CYAN, AMBER, MAGENTA are removed from ColorToken enum."""
-        from backend.app.constants.colors import ColorToken
-
         enum_values = [token.value for token in ColorToken]
 
         for old_token in OLD_TOKENS_REMOVED:
@@ -73,8 +69,6 @@ class TestColorsDict:
 
     def test_colors_dict_contains_all_8_colors(self):
         """Test that COLORS dict has all 8 new palette colors."""
-        from backend.app.constants.colors import COLORS, ColorToken
-
         assert len(COLORS) == 8, f"Expected 8 colors in COLORS dict, got {len(COLORS)}"
 
         for token_name in NEW_PALETTE_TOKENS:
@@ -83,16 +77,12 @@ class TestColorsDict:
 
     def test_colors_dict_values_are_valid_hex(self):
         """Test that all color values are valid hex format (#RRGGBB)."""
-        from backend.app.constants.colors import COLORS
-
         for token, hex_value in COLORS.items():
             assert isinstance(hex_value, str), f"{token}: Expected string value, got {type(hex_value)}"
             assert HEX_PATTERN.match(hex_value), f"{token}: Invalid hex format: {hex_value}"
 
     def test_colors_dict_values_match_expected(self):
         """Test that COLORS dict hex values match expected palette."""
-        from backend.app.constants.colors import COLORS, ColorToken
-
         for token_name, expected_hex in EXPECTED_HEX_VALUES.items():
             token = ColorToken(token_name)
             actual_hex = COLORS[token]
@@ -106,8 +96,6 @@ class TestLoadColorsFromJson:
 
     def test_load_colors_returns_flat_dict(self):
         """Test that _load_colors_from_json returns Dict[ColorToken, str] (flat structure)."""
-        from backend.app.constants.colors import _load_colors_from_json, ColorToken
-
         colors = _load_colors_from_json()
 
         # Should return flat dict, not nested with ColorVariant
@@ -15,6 +15,8 @@ Updated for accessible color palette (2025-12-27):
 import json
 from pathlib import Path
 
+from backend.app.constants.colors import COLORS, ColorToken
+
 
 # Paths relative to project root
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -46,8 +48,6 @@ class TestCrossPlatformSynchronization:
 
         Updated for flat hex structure (no variants).
         """
-        from backend.app.constants.colors import COLORS, ColorToken
-
         source_colors = load_source_colors()
         mismatches = []
 
@@ -106,13 +106,11 @@ class TestCrossPlatformSynchronization:
 
         This ensures no tokens are accidentally omitted from either platform.
         """
-        from backend.app.constants.colors import ColorToken as PyColorToken
-
         source_colors = load_source_colors()
         source_token_names = set(source_colors.keys())
 
         # Check Python has all tokens
-        python_token_names = {token.value for token in PyColorToken}
+        python_token_names = {token.value for token in ColorToken}
         missing_in_python = source_token_names - python_token_names
         assert not missing_in_python, (
             f"Python ColorToken missing tokens: {missing_in_python}"
@@ -11,6 +11,8 @@ These tests verify:
 
 import json
 
+import pytest
+
 from backend.app.constants.colors import ColorToken
 from backend.app.constants.color_labels import Language
 from backend.app.models.puzzle import PuzzleGrid
@@ -32,14 +34,29 @@ STANDARD_TIER_COLORS = [
     ColorToken.BLACK, ColorToken.BLUE, ColorToken.ORANGE, ColorToken.YELLOW
 ]
 
+# Hashed membership sets for per-cell palette checks
+_NEW_PALETTE_SET = frozenset(NEW_PALETTE_TOKENS)
+_STANDARD_SET = frozenset(STANDARD_TIER_COLORS)
+_ACCESSIBLE_SET = frozenset({ColorToken.BLACK, ColorToken.YELLOW})
+
+
+@pytest.fixture(scope="module")
+def shared_puzzle():
+    """Generate the seed-12345 puzzle once and share it across the serialization tests."""
+    puzzle = PuzzleGenerator(seed=12345).generate()
+    return puzzle, puzzle.to_dict()
+
 
 class TestDistributionValidation:
     """Test distribution validation functionality with new accessible palette."""
 
-    def test_validator_rejects_heavily_skewed_distribution(self):
-        """Test that validator rejects grids with heavily skewed color distribution."""
-        validator = DistributionValidator(min_count=6, max_count=10)
+    @pytest.fixture
+    def validator(self):
+        """Validator with the 6-10 tolerance band used by these tests."""
+        return DistributionValidator(min_count=6, max_count=10)
 
+    def test_validator_rejects_heavily_skewed_distribution(self, validator):
+        """Test that validator rejects grids with heavily skewed color distribution."""
         skewed_counts = {
             ColorToken.BLUE: 20,
             ColorToken.ORANGE: 2,
@@ -56,10 +73,8 @@ class TestDistributionValidation:
         assert not result.is_valid
         assert len(result.issues) > 0
 
-    def test_validator_accepts_distribution_within_tolerance(self):
+    def test_validator_accepts_distribution_within_tolerance(self, validator):
         """Test that validator accepts grids within acceptable tolerance."""
-        validator = DistributionValidator(min_count=6, max_count=10)
-
         balanced_counts = {token: 8 for token in NEW_PALETTE_TOKENS}
 
         result = validator.validate(balanced_counts)
@@ -67,10 +82,8 @@ class TestDistributionValidation:
         assert result.is_valid
         assert len(result.issues) == 0
 
-    def test_validator_accepts_minor_variation(self):
+    def test_validator_accepts_minor_variation(self, validator):
         """Test that validator accepts distribution with minor variation."""
-        validator = DistributionValidator(min_count=6, max_count=10)
-
         varied_counts = {
             ColorToken.BLUE: 6,
             ColorToken.ORANGE: 10,
@@ -90,12 +103,9 @@ class TestDistributionValidation:
 class TestJsonSerialization:
     """Test JSON serialization of puzzle structures."""
 
-    def test_json_output_format_matches_expected_structure(self):
+    def test_json_output_format_matches_expected_structure(self, shared_puzzle):
         """Test JSON output format matches expected structure."""
-        generator = PuzzleGenerator(seed=12345)
-        puzzle = generator.generate()
-
-        data = puzzle.to_dict()
+        _, data = shared_puzzle
 
         assert "grid" in data
         assert "metadata" in data
@@ -112,85 +122,61 @@ class TestJsonSerialization:
         assert "cols" in meta
         assert "congruencePercentage" in meta
 
-    def test_to_dict_produces_json_serializable_output(self):
+    def test_to_dict_produces_json_serializable_output(self, shared_puzzle):
         """Test that to_dict() produces JSON-serializable output."""
-        generator = PuzzleGenerator(seed=12345)
-        puzzle = generator.generate()
-
-        data = puzzle.to_dict()
+        _, data = shared_puzzle
 
-        json_string = json.dumps(data)
-        assert isinstance(json_string, str)
+        json_string = json.dumps(data, separators=(",", ":"))
 
-        parsed = json.loads(json_string)
-        assert parsed == data
+        assert json.loads(json_string) == data
 
-    def test_color_tokens_serialized_as_strings(self):
+    def test_color_tokens_serialized_as_strings(self, shared_puzzle):
         """Test that ColorToken values are serialized as strings."""
-        generator = PuzzleGenerator(seed=12345)
-        puzzle = generator.generate()
+        _, data = shared_puzzle
+
+        assert all(
+            isinstance(cell["word"], str) and isinstance(cell["inkColor"], str)
+            for row in data["grid"]
+            for cell in row
+        )
 
-        data = puzzle.to_dict()
 
-        for row in data["grid"]:
-            for cell in row:
-                assert isinstance(cell["word"], str)
-                assert isinstance(cell["inkColor"], str)
+def _assert_grid_shape(puzzle):
+    """Assert that a generated puzzle is a full 8x8 PuzzleGrid."""
+    assert isinstance(puzzle, PuzzleGrid)
+    assert len(puzzle.cells) == 8
+    assert all(len(row) == 8 for row in puzzle.cells)
 
 
 class TestEdgeCaseSeeds:
     """Test edge case seed values for robustness."""
 
-    def test_seed_zero_produces_valid_grid(self):
-        """Test that seed=0 produces a valid 8x8 grid."""
-        generator = PuzzleGenerator(seed=0)
+    @pytest.mark.parametrize("seed", [0, 2**30 - 1])
+    def test_edge_case_seed_produces_valid_grid(self, seed):
+        """Test that seed=0 and a very large seed produce a valid 8x8 grid."""
+        generator = PuzzleGenerator(seed=seed)
         puzzle = generator.generate()
 
-        assert isinstance(puzzle, PuzzleGrid)
-        assert len(puzzle.cells) == 8
-        assert all(len(row) == 8 for row in puzzle.cells)
-        assert puzzle.metadata.seed == 0
-
-    def test_very_large_seed_produces_valid_grid(self):
-        """Test that a very large seed value produces a valid grid."""
-        large_seed = 2**30 - 1
-        generator = PuzzleGenerator(seed=large_seed)
-        puzzle = generator.generate()
-
-        assert isinstance(puzzle, PuzzleGrid)
-        assert len(puzzle.cells) == 8
-        assert all(len(row) == 8 for row in puzzle.cells)
-        assert puzzle.metadata.seed == large_seed
+        _assert_grid_shape(puzzle)
+        assert puzzle.metadata.seed == seed
 
 
 class TestExtremeCongruenceValues:
     """Test extreme congruence values (0.0 and 1.0)."""
 
-    def test_zero_congruence_produces_no_matches(self):
-        """Test that 0.0 congruence produces zero word-ink matches."""
-        generator = PuzzleGenerator(seed=42, congruence_percentage=0.0)
+    @pytest.mark.parametrize("cong,expected", [(0.0, 0), (1.0, 64)])
+    def test_extreme_congruence_match_count(self, cong, expected):
+        """Test that 0.0 congruence yields no word-ink matches and 1.0 yields all."""
+        generator = PuzzleGenerator(seed=42, congruence_percentage=cong)
         puzzle = generator.generate()
 
-        congruent_count = 0
-        for row in puzzle.cells:
-            for cell in row:
-                if cell.word == cell.ink_color:
-                    congruent_count += 1
-
-        assert congruent_count == 0
+        _assert_grid_shape(puzzle)
 
-    def test_full_congruence_produces_all_matches(self):
-        """Test that 1.0 congruence produces all word-ink matches."""
-        generator = PuzzleGenerator(seed=42, congruence_percentage=1.0)
-        puzzle = generator.generate()
-
-        congruent_count = 0
-        for row in puzzle.cells:
-            for cell in row:
-                if cell.word == cell.ink_color:
-                    congruent_count += 1
+        congruent_count = sum(
+            cell.word == cell.ink_color for row in puzzle.cells for cell in row
+        )
 
-        assert congruent_count == 64
+        assert congruent_count == expected
 
 
 class TestEndToEndGenerationWorkflow:
@@ -223,43 +209,33 @@ class TestEndToEndGenerationWorkflow:
         generator2 = PuzzleGenerator(seed=seed, congruence_percentage=congruence)
         puzzle2 = generator2.generate()
 
-        for r in range(8):
-            for c in range(8):
-                assert puzzle.cells[r][c].word == puzzle2.cells[r][c].word
-                assert puzzle.cells[r][c].ink_color == puzzle2.cells[r][c].ink_color
+        def signature(p):
+            return tuple((cell.word, cell.ink_color) for row in p.cells for cell in row)
+
+        assert signature(puzzle) == signature(puzzle2)
 
 
 class TestNewAccessiblePaletteColors:
     """Test that puzzle generation uses the new accessible color palette."""
 
-    def test_generated_colors_are_from_new_palette(self):
-        """Test that all generated ink colors are from the new accessible palette."""
-        generator = PuzzleGenerator(seed=42, color_count=8)
-        puzzle = generator.generate()
-
-        for row in puzzle.cells:
-            for cell in row:
-                assert cell.ink_color in NEW_PALETTE_TOKENS
-                assert cell.word in NEW_PALETTE_TOKENS
-
-    def test_accessible_tier_uses_only_black_and_yellow(self):
-        """Test that 2-color 'Accessible' tier uses only BLACK and YELLOW."""
-        generator = PuzzleGenerator(seed=42, color_count=2)
-        puzzle = generator.generate()
-
-        accessible_colors = [ColorToken.BLACK, ColorToken.YELLOW]
-
-        for row in puzzle.cells:
-            for cell in row:
-                assert cell.ink_color in accessible_colors
-                assert cell.word in accessible_colors
-
-    def test_standard_tier_uses_four_colors(self):
-        """Test that 4-color 'Standard' tier uses BLACK, BLUE, ORANGE, YELLOW."""
-        generator = PuzzleGenerator(seed=42, color_count=4)
-        puzzle = generator.generate()
-
-        for row in puzzle.cells:
-            for cell in row:
-                assert cell.ink_color in STANDARD_TIER_COLORS
-                assert cell.word in STANDARD_TIER_COLORS
+    @pytest.mark.parametrize(
+        "color_count, allowed",
+        [(8, _NEW_PALETTE_SET), (4, _STANDARD_SET), (2, _ACCESSIBLE_SET)],
+        ids=["full-palette", "standard-tier", "accessible-tier"],
+    )
+    def test_generated_colors_from_palette(self, color_count, allowed):
+        """
+        Test that words and ink colors come only from the tier's palette.
+
+        8 colors use the full accessible palette, 4-color 'Standard' uses
+        BLACK, BLUE, ORANGE, YELLOW, and 2-color 'Accessible' uses BLACK and YELLOW.
+        """
+        puzzle = PuzzleGenerator(seed=42, color_count=color_count).generate()
+
+        bad = [
+            (cell.word, cell.ink_color)
+            for row in puzzle.cells
+            for cell in row
+            if cell.word not in allowed or cell.ink_color not in allowed
+        ]
+        assert not bad
@@ -14,8 +14,11 @@ Updated for the accessible color palette replacement:
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
+from backend.app.constants.colors import COLORS, ColorToken, _load_colors_from_json
+
 
 # Path to the shared colors.json file
 COLORS_JSON_PATH = Path(__file__).parent.parent / "shared" / "colors.json"
@@ -30,10 +33,15 @@ REMOVED_TOKENS = ["CYAN", "AMBER", "MAGENTA"]
 HEX_PATTERN = re.compile(r"^#[0-9A-Fa-f]{6}$")
 
 
+@lru_cache(maxsize=1)
 def load_source_colors():
-    """Load and parse the source colors.json file."""
-    with open(COLORS_JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    Load and parse the source colors.json file.
+
+    Cached so the file is parsed once per session; callers must not mutate
+    the returned dict.
+    """
+    return json.loads(COLORS_JSON_PATH.read_bytes())
 
 
 class TestColorTokenStrEnum:
@@ -41,8 +49,6 @@ class TestColorTokenStrEnum:
 
     def test_color_token_contains_all_new_tokens(self):
         """Test that ColorToken enum has all 8 new accessible palette tokens."""
-        from backend.app.constants.colors import ColorToken
-
         enum_values = [token.value for token in ColorToken]
 
         for token_name in REQUIRED_TOKENS:
@@ -50,14 +56,10 @@ class TestColorTokenStrEnum:
 
     def test_color_token_count(self):
         """Test that ColorToken has exactly 8 tokens."""
-        from backend.app.constants.colors import ColorToken
-
         assert len(ColorToken) == 8, f"Expected 8 ColorToken values, got {len(ColorToken)}"
 
     def test_old_tokens_removed(self):
         """Test that old tokens (CYAN, AMBER, MAGENTA) are removed from ColorToken."""
-        from backend.app.constants.colors import ColorToken
-
         enum_values = [token.value for token in ColorToken]
 
         for old_token in REMOVED_TOKENS:
@@ -69,11 +71,9 @@ class TestColorVariantRemoved:
 
     def test_color_variant_not_importable(self):
         """Test that ColorVariant is not available for import."""
-        try:
-            from backend.app.constants.colors import ColorVariant
-            assert False, "ColorVariant should not exist in colors module"
-        except ImportError:
-            pass  # Expected - ColorVariant should not be importable
+        from backend.app.constants import colors as _c
+
+        assert not hasattr(_c, "ColorVariant"), "ColorVariant should not exist in colors module"
 
 
 class TestColorsDict:
@@ -81,8 +81,6 @@ class TestColorsDict:
 
     def test_colors_dict_matches_source_json_tokens(self):
         """Test that COLORS dictionary has all tokens from source JSON."""
-        from backend.app.constants.colors import COLORS, ColorToken
-
         source_colors = load_source_colors()
 
         for token_name in source_colors.keys():
@@ -91,8 +89,6 @@ class TestColorsDict:
 
     def test_colors_dict_returns_flat_hex_strings(self):
         """Test that COLORS returns flat hex strings (not variant dicts)."""
-        from backend.app.constants.colors import COLORS, ColorToken
-
         for token in ColorToken:
             hex_value = COLORS[token]
             # Should be a string, not a dict
@@ -106,8 +102,6 @@ class TestColorsDict:
 
     def test_colors_dict_hex_values_match_source(self):
         """Test that COLORS hex values match source JSON exactly."""
-        from backend.app.constants.colors import COLORS, ColorToken
-
         source_colors = load_source_colors()
 
         for token_name, expected_hex in source_colors.items():
@@ -120,8 +114,6 @@ class TestColorsDict:
 
     def test_colors_dict_count(self):
         """Test that COLORS dict contains exactly 8 colors."""
-        from backend.app.constants.colors import COLORS
-
         assert len(COLORS) == 8, f"Expected 8 colors in COLORS dict, got {len(COLORS)}"
 
 
@@ -130,8 +122,6 @@ class TestLoadColorsFromJson:
 
     def test_load_colors_returns_flat_dict(self):
         """Test that _load_colors_from_json returns Dict[ColorToken, str]."""
-        from backend.app.constants.colors import _load_colors_from_json, ColorToken
-
         colors = _load_colors_from_json()
 
         for token, value in colors.items():
@@ -141,7 +131,5 @@ class TestLoadColorsFromJson:
 
     def test_load_colors_returns_correct_count(self):
         """Test that _load_colors_from_json returns exactly 8 colors."""
-        from backend.app.constants.colors import _load_colors_from_json
-
         colors = _load_colors_from_json()
         assert len(colors) == 8, f"Expected 8 colors, got {len(colors)}"
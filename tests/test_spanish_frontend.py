@@ -6,65 +6,77 @@ These tests verify Spanish language support in:
 - Integration across all layers
 """
 
-import json
 import re
-from pathlib import Path
+from collections.abc import Mapping
 
-from conftest import load_puzzle_html, load_puzzle_js
+import pytest
 
+from conftest import SUPPORTED_LANGUAGES
 
-PROJECT_ROOT = Path(__file__).parent.parent
-COLOR_LABELS_JSON_PATH = PROJECT_ROOT / "shared" / "color_labels.json"
-UI_TEXT_JSON_PATH = PROJECT_ROOT / "shared" / "ui_text.json"
+from _spanish_fixtures import EXPECTED_SPANISH_LABELS, EXPECTED_COLOR_TOKENS
 
-# Expected Spanish translations for color labels (accessible palette)
-EXPECTED_SPANISH_LABELS = {
-    "BLACK": "Negro",
-    "BROWN": "Cafe",
-    "PURPLE": "Morado",
-    "BLUE": "Azul",
-    "GRAY": "Gris",
-    "PINK": "Rosa",
-    "ORANGE": "Naranja",
-    "YELLOW": "Amarillo",
-}
 
-EXPECTED_COLOR_TOKENS = {"BLACK", "BROWN", "PURPLE", "BLUE", "GRAY", "PINK", "ORANGE", "YELLOW"}
-ALL_SUPPORTED_LANGUAGES = ["zh-TW", "english", "vietnamese", "spanish"]
+# Patterns compiled once at import rather than per test call
+_SPANISH_OPTION_RE = re.compile(r'<option\s+value="spanish"\s*>Spanish</option>')
+_SPANISH_FONT_RE = re.compile(r"spanish\s*:\s*4\.2")
+_CELL_WIDTH_RE = re.compile(r"cellWidth\s*\*\s*0\.8")
+_VALID_LANGUAGES_RE = re.compile(r"const\s+VALID_LANGUAGES\s*=\s*\[([^\]]+)\]")
 
+_DESCRIPTOR_KEYS = frozenset({
+    "language_descriptor_zh-TW",
+    "language_descriptor_english",
+    "language_descriptor_vietnamese",
+    "language_descriptor_spanish",
+})
 
-def load_color_labels() -> dict:
-    """Load the color_labels.json file."""
-    with open(COLOR_LABELS_JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+_CRITICAL_KEYS = frozenset({
+    "check_btn",
+    "clear_btn",
+    "generate_btn",
+    "enter_answers_header",
+    "results_header",
+    "answer_key_header",
+    "result_perfect",
+    "result_good",
+    "result_needs_work",
+})
 
 
-def load_ui_text() -> dict:
-    """Load the ui_text.json file."""
-    with open(UI_TEXT_JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _assert_spanish_translations(ui_text: Mapping, keys: frozenset, kind: str) -> None:
+    """Assert every key exists in ui_text with a non-blank Spanish translation."""
+    missing = keys - ui_text.keys()
+    assert not missing, f"Missing {kind} entries: {sorted(missing)}"
+
+    spanish_by_key = {key: ui_text[key].get("spanish") for key in keys}
+
+    missing_spanish = sorted(key for key, text in spanish_by_key.items() if text is None)
+    assert not missing_spanish, (
+        f"{kind} entries missing 'spanish' translation: {missing_spanish}"
+    )
+
+    empty_spanish = sorted(
+        key for key, text in spanish_by_key.items()
+        if text is not None and (not text or text.isspace())
+    )
+    assert not empty_spanish, (
+        f"{kind} entries with empty Spanish translation: {empty_spanish}"
+    )
 
 
 class TestFrontendSpanishLanguageSupport:
     """Verify Spanish language support in frontend puzzle.html."""
 
-    def test_language_dropdown_includes_spanish_option(self):
+    def test_language_dropdown_includes_spanish_option(self, puzzle_html):
         """Test that language dropdown includes Spanish option."""
-        html_content = load_puzzle_html()
-
-        spanish_option_pattern = r'<option\s+value="spanish"\s*>Spanish</option>'
-        match = re.search(spanish_option_pattern, html_content)
+        match = _SPANISH_OPTION_RE.search(puzzle_html)
 
         assert match is not None, (
             "Language dropdown should include <option value=\"spanish\">Spanish</option>"
         )
 
-    def test_valid_languages_array_includes_spanish(self):
+    def test_valid_languages_array_includes_spanish(self, puzzle_js):
         """Test that VALID_LANGUAGES array includes 'spanish'."""
-        js_content = load_puzzle_js()
-
-        valid_languages_pattern = r"const\s+VALID_LANGUAGES\s*=\s*\[([^\]]+)\]"
-        match = re.search(valid_languages_pattern, js_content)
+        match = _VALID_LANGUAGES_RE.search(puzzle_js)
 
         assert match is not None, (
             "VALID_LANGUAGES array declaration not found in JavaScript modules"
@@ -75,31 +87,26 @@ class TestFrontendSpanishLanguageSupport:
             "VALID_LANGUAGES array should include 'spanish'"
         )
 
-    def test_width_multipliers_includes_spanish_entry(self):
+    def test_width_multipliers_includes_spanish_entry(self, puzzle_index):
         """Test that widthMultipliers object includes 'spanish' entry."""
-        js_content = load_puzzle_js()
-
-        width_multipliers_pattern = r"widthMultipliers\s*=\s*\{([^}]+)\}"
-        match = re.search(width_multipliers_pattern, js_content)
+        object_content = puzzle_index.get("widthMultipliers")
 
-        assert match is not None, (
+        assert object_content is not None, (
             "widthMultipliers object declaration not found in JavaScript modules"
         )
 
-        object_content = match.group(1)
         assert "spanish:" in object_content or "spanish :" in object_content, (
             "widthMultipliers object should include 'spanish' entry"
         )
 
-    def test_dynamic_font_sizing_supports_spanish(self):
+    def test_dynamic_font_sizing_supports_spanish(self, puzzle_js, puzzle_index):
         """Test that dynamic font sizing supports Spanish language."""
-        js_content = load_puzzle_js()
-
-        assert "spanish: 4.2" in js_content or "spanish:4.2" in js_content, (
+        width_multipliers = puzzle_index.get("widthMultipliers", "")
+        assert _SPANISH_FONT_RE.search(width_multipliers) is not None, (
             "widthMultipliers should include spanish with value 4.2"
         )
 
-        assert "cellWidth * 0.8" in js_content or "cellWidth*0.8" in js_content, (
+        assert _CELL_WIDTH_RE.search(puzzle_js) is not None, (
             "Dynamic font calculation should use cellWidth * 0.8 formula"
         )
 
@@ -107,86 +114,44 @@ class TestFrontendSpanishLanguageSupport:
 class TestSpanishLanguageIntegration:
     """Integration tests for Spanish language support."""
 
-    def test_spanish_color_labels_max_length_within_budget(self):
+    def test_spanish_color_labels_max_length_within_budget(self, color_labels):
         """Test that Spanish color labels do not exceed 8 character budget."""
-        color_labels = load_color_labels()
         max_length = 8
 
-        for token in EXPECTED_COLOR_TOKENS:
-            spanish_label = color_labels[token]["spanish"]
-            assert len(spanish_label) <= max_length, (
-                f"Spanish label for {token} ('{spanish_label}') exceeds {max_length} characters"
-            )
+        longest_length, longest_token = max(
+            (len(color_labels[token]["spanish"]), token) for token in EXPECTED_COLOR_TOKENS
+        )
+        assert longest_length <= max_length, (
+            f"Spanish label for {longest_token} ('{color_labels[longest_token]['spanish']}') "
+            f"exceeds {max_length} characters"
+        )
 
-    def test_all_language_descriptors_include_spanish_translation(self):
+    def test_all_language_descriptors_include_spanish_translation(self, ui_text):
         """Test that all language descriptor entries include Spanish translation."""
-        ui_text = load_ui_text()
-
-        descriptor_keys = [
-            "language_descriptor_zh-TW",
-            "language_descriptor_english",
-            "language_descriptor_vietnamese",
-            "language_descriptor_spanish",
-        ]
-
-        for key in descriptor_keys:
-            assert key in ui_text, f"Missing language descriptor: {key}"
-            assert "spanish" in ui_text[key], (
-                f"Language descriptor '{key}' missing 'spanish' translation"
-            )
-            assert ui_text[key]["spanish"].strip() != "", (
-                f"Language descriptor '{key}' has empty Spanish translation"
-            )
-
-    def test_critical_workflow_ui_elements_have_spanish_translations(self):
+        _assert_spanish_translations(ui_text, _DESCRIPTOR_KEYS, "language descriptor")
+
+    def test_critical_workflow_ui_elements_have_spanish_translations(self, ui_text):
         """Test that critical UI elements have Spanish translations."""
-        ui_text = load_ui_text()
-
-        critical_keys = [
-            "check_btn",
-            "clear_btn",
-            "generate_btn",
-            "enter_answers_header",
-            "results_header",
-            "answer_key_header",
-            "result_perfect",
-            "result_good",
-            "result_needs_work",
-        ]
-
-        for key in critical_keys:
-            assert key in ui_text, f"Missing critical UI element: {key}"
-            assert "spanish" in ui_text[key], (
-                f"Critical UI element '{key}' missing Spanish translation"
-            )
-            spanish_text = ui_text[key]["spanish"]
-            assert spanish_text.strip() != "", (
-                f"Critical UI element '{key}' has empty Spanish translation"
-            )
-
-    def test_all_four_languages_have_consistent_structure_in_color_labels(self):
+        _assert_spanish_translations(ui_text, _CRITICAL_KEYS, "critical UI element")
+
+    @pytest.mark.parametrize("token", sorted(EXPECTED_COLOR_TOKENS))
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_all_four_languages_have_consistent_structure_in_color_labels(
+        self, color_labels, token, lang
+    ):
         """Test that all four languages have consistent structure in color_labels.json."""
-        color_labels = load_color_labels()
-
-        for token in EXPECTED_COLOR_TOKENS:
-            for lang in ALL_SUPPORTED_LANGUAGES:
-                assert lang in color_labels[token], (
-                    f"Color {token} missing '{lang}' language key"
-                )
-                label = color_labels[token][lang]
-                assert label is not None and label.strip() != "", (
-                    f"Color {token} has empty or None '{lang}' label"
-                )
-
-    def test_spanish_translations_use_appropriate_vocabulary(self):
+        assert lang in color_labels[token], (
+            f"Color {token} missing '{lang}' language key"
+        )
+        label = color_labels[token][lang]
+        assert label and not label.isspace(), (
+            f"Color {token} has empty or whitespace '{lang}' label"
+        )
+
+    def test_spanish_translations_use_appropriate_vocabulary(self, color_labels):
         """Test that Spanish translations use appropriate vocabulary."""
-        color_labels = load_color_labels()
-
-        for token, expected_label in EXPECTED_SPANISH_LABELS.items():
-            actual_label = color_labels[token]["spanish"]
-            assert "." not in actual_label, (
-                f"Spanish label for {token} appears to be abbreviated: '{actual_label}'"
-            )
-            assert actual_label == expected_label, (
-                f"Spanish label for {token} should be '{expected_label}', got '{actual_label}'"
-            )
+        actual = {token: color_labels[token]["spanish"] for token in EXPECTED_SPANISH_LABELS}
+
+        abbreviated = {token: label for token, label in actual.items() if "." in label}
+        assert not abbreviated, f"Spanish labels appear to be abbreviated: {abbreviated}"
+        assert actual == EXPECTED_SPANISH_LABELS
@@ -11,7 +11,24 @@ import pytest
 
 from backend.app.constants.colors import ColorToken
 from backend.app.models.puzzle import PuzzleCell
-from backend.app.services.puzzle_generator import PuzzleGenerator
+from backend.app.services.puzzle_generator import (
+    PuzzleGenerator,
+    _bounded_adjacency,
+    _cell_interference,
+    _edge_list,
+)
+
+
+@pytest.fixture(scope="module")
+def pregen() -> dict:
+    """
+    Generate the fixed-seed 4-color puzzles shared by this module's tests.
+    Keyed by seed; tests must not mutate the returned grids.
+    """
+    return {
+        seed: PuzzleGenerator(seed=seed, color_count=4).generate()
+        for seed in (42424, 99999)
+    }
 
 
 class TestStroopOptimization:
@@ -49,6 +66,56 @@ class TestStroopOptimization:
         assert len(adj) == 4
         assert set(adj) == {1, 4, 6, 9}  # up, left, right, down
 
+    def test_get_adjacent_indices_rejects_negative_index(self):
+        """A negative index should raise instead of wrapping around."""
+        gen = PuzzleGenerator(seed=42)
+
+        with pytest.raises(ValueError):
+            gen._get_adjacent_indices(-1, grid_size=4)
+
+    def test_cells_beyond_grid_size_squared(self):
+        """Cell lists longer than grid_size**2 should keep row/column bounds."""
+        gen = PuzzleGenerator(seed=24680, color_count=2)
+
+        # Row 3 of a 3-wide grid: up, left and right but no down neighbor
+        assert set(gen._get_adjacent_indices(10, grid_size=3)) == {7, 9, 11}
+
+        for grid_size, cell_count in ((3, 12), (4, 20)):
+            # Checkerboard pattern: every neighbor pair interferes both ways
+            checker = [sum(divmod(i, grid_size)) % 2 for i in range(cell_count)]
+            cells = [
+                PuzzleCell(
+                    word=ColorToken.BLACK if odd else ColorToken.YELLOW,
+                    ink_color=ColorToken.YELLOW if odd else ColorToken.BLACK,
+                )
+                for odd in checker
+            ]
+
+            last = cell_count - 1
+            neighbors = gen._get_adjacent_indices(last, grid_size)
+            assert gen._interference_at(cells, last, grid_size) == 2 * len(neighbors)
+
+            optimized = gen._optimize_stroop_interference(cells, grid_size)
+            assert len(optimized) == cell_count
+
+    def test_bounded_adjacency_covers_every_cell(self):
+        """The bounded table should have one in-range entry per cell, at any count."""
+        for cell_count in (5, 9, 12):
+            table = _bounded_adjacency(3, cell_count)
+
+            assert len(table) == cell_count
+            assert all(0 <= j < cell_count for neighbors in table for j in neighbors)
+
+        assert _bounded_adjacency(3, 12)[9] == (6, 10)  # up, right
+
+    def test_edge_list_has_each_adjacent_pair_once(self):
+        """A 4x4 grid has 24 adjacent pairs, each listed once with i < j."""
+        edges = _edge_list(4)
+
+        assert len(edges) == 24
+        assert len(set(edges)) == 24
+        assert all(i < j for i, j in edges)
+
     def test_interference_at_counts_correctly(self):
         """Interference count should include both directions of matching."""
         gen = PuzzleGenerator(seed=42)
@@ -71,6 +138,32 @@ class TestStroopOptimization:
         interference_0 = gen._interference_at(cells, 0, grid_size=2)
         assert interference_0 == 2  # Both directions match
 
+    def test_interference_at_agrees_with_cell_interference(self):
+        """The PuzzleCell and parallel-list kernels should count every cell alike."""
+        gen = PuzzleGenerator(seed=1357, color_count=4)
+        cells_flat = gen._assign_words(gen._create_ink_distribution())
+        gen._rng.shuffle(cells_flat)
+        words = [cell.word for cell in cells_flat]
+        inks = [cell.ink_color for cell in cells_flat]
+        adjacency = _bounded_adjacency(gen.COLS, len(cells_flat))
+
+        for i in range(len(cells_flat)):
+            assert gen._interference_at(cells_flat, i, gen.COLS) == (
+                _cell_interference(words, inks, i, adjacency)
+            )
+
+    def test_total_interference_counts_each_pair_once(self):
+        """Grid total should equal the per-cell counts with each pair halved."""
+        gen = PuzzleGenerator(seed=2468, color_count=4)
+        cells_flat = gen._assign_words(gen._create_ink_distribution())
+
+        per_cell_sum = sum(
+            gen._interference_at(cells_flat, i, gen.COLS)
+            for i in range(len(cells_flat))
+        )
+
+        assert gen._total_interference(cells_flat, gen.COLS) * 2 == per_cell_sum
+
     def test_optimization_increases_interference(self):
         """Optimization should increase or maintain interference pair count."""
         gen = PuzzleGenerator(seed=12345, color_count=4)
@@ -81,19 +174,13 @@ class TestStroopOptimization:
         gen._rng.shuffle(cells_flat)
 
         # Count interference before optimization
-        before_count = sum(
-            gen._interference_at(cells_flat, i, gen.COLS)
-            for i in range(len(cells_flat))
-        )
+        before_count = gen._total_interference(cells_flat, gen.COLS)
 
         # Optimize
         optimized = gen._optimize_stroop_interference(cells_flat, gen.COLS)
 
         # Count interference after optimization
-        after_count = sum(
-            gen._interference_at(optimized, i, gen.COLS)
-            for i in range(len(optimized))
-        )
+        after_count = gen._total_interference(optimized, gen.COLS)
 
         # Should be at least as good (greedy algorithm)
         assert after_count >= before_count
@@ -122,9 +209,9 @@ class TestStroopOptimization:
         assert before_ink == after_ink
         assert before_word == after_word
 
-    def test_optimization_is_deterministic(self):
+    def test_optimization_is_deterministic(self, pregen):
         """Same seed should produce same optimized puzzle."""
-        puzzle1 = PuzzleGenerator(seed=99999, color_count=4).generate()
+        puzzle1 = pregen[99999]
         puzzle2 = PuzzleGenerator(seed=99999, color_count=4).generate()
 
         # Flatten both grids and compare
@@ -182,10 +269,23 @@ class TestStroopOptimization:
         # Should still have same cells
         assert len(optimized) == 16
 
-    def test_full_generate_includes_optimization(self):
+    def test_optimization_skips_search_at_structural_maximum(self):
+        """A grid where every pair interferes both ways should return without sampling swaps."""
+        gen = PuzzleGenerator(seed=13579, color_count=2)
+        cells = [
+            PuzzleCell(word=ColorToken.BLACK, ink_color=ColorToken.BLACK)
+            for _ in range(9)
+        ]
+        rng_state = gen._rng.getstate()
+
+        optimized = gen._optimize_stroop_interference(cells, grid_size=3)
+
+        assert optimized == cells
+        assert gen._rng.getstate() == rng_state
+
+    def test_full_generate_includes_optimization(self, pregen):
         """Full puzzle generation should produce optimized grids."""
-        # Generate two puzzles with same seed
-        puzzle = PuzzleGenerator(seed=42424, color_count=4).generate()
+        puzzle = pregen[42424]
 
         # Verify grid structure is intact
         assert len(puzzle.cells) == 8
@@ -9,16 +9,21 @@ Updated for the accessible color palette replacement:
 - All language references updated accordingly
 """
 
-import json
-from pathlib import Path
+from collections.abc import Mapping
 
+import pytest
 
-# Paths relative to project root
-PROJECT_ROOT = Path(__file__).parent.parent
-UI_TEXT_JSON_PATH = PROJECT_ROOT / "shared" / "ui_text.json"
+from backend.app.constants.color_labels import Language
+from backend.app.constants.ui_text import get_ui_text, UI_TEXT
 
-# Required UI text keys that must be present for each language
-REQUIRED_UI_TEXT_KEYS = [
+from conftest import SUPPORTED_LANGUAGES_SET
+
+
+# Languages every required key must translate
+REQUIRED_UI_TEXT_LANGUAGES = frozenset({"zh-TW", "english", "vietnamese"})  # Updated from "chinese"
+
+# UI text keys that must be translated into every REQUIRED_UI_TEXT_LANGUAGES entry
+REQUIRED_UI_TEXT_KEYS = frozenset({
     "page_title",
     "subtitle",
     "task_label",
@@ -51,13 +56,7 @@ REQUIRED_UI_TEXT_KEYS = [
     "language_descriptor_zh-TW",  # Updated from language_descriptor_chinese
     "language_descriptor_english",
     "language_descriptor_vietnamese",
-]
-
-
-def load_ui_text() -> dict:
-    """Load the ui_text.json file."""
-    with open(UI_TEXT_JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+})
 
 
 class TestUITextDataLoading:
@@ -68,77 +67,71 @@ class TestUITextDataLoading:
     and can be loaded at module initialization time.
     """
 
-    def test_ui_text_json_loads_correctly(self):
+    def test_ui_text_json_loads_correctly(self, ui_text):
         """
         Test that ui_text.json loads correctly at module initialization.
 
         This verifies the JSON file exists, is valid JSON, and can be parsed.
         """
-        ui_text = load_ui_text()
-
-        assert isinstance(ui_text, dict), (
-            "ui_text.json should parse to a dictionary"
+        assert isinstance(ui_text, Mapping), (
+            "ui_text.json should parse to a mapping"
         )
         assert len(ui_text) > 0, (
             "ui_text.json should contain at least one key"
         )
 
-    def test_all_required_ui_text_keys_exist_for_each_language(self):
+    @pytest.mark.parametrize("key", sorted(REQUIRED_UI_TEXT_KEYS))
+    @pytest.mark.parametrize("lang", sorted(REQUIRED_UI_TEXT_LANGUAGES))
+    def test_required_ui_text_key_exists_for_language(self, ui_text, key, lang):
         """
-        Test that all required UI text keys exist for each language.
+        Test that a required UI text key exists for a language.
 
-        This verifies zh-TW, english, and vietnamese translations exist
-        for every required UI text key.
+        Parametrized over every required key and zh-TW, english, and
+        vietnamese so each translation is reported as its own case.
         """
-        ui_text = load_ui_text()
-        languages = ["zh-TW", "english", "vietnamese"]  # Updated from "chinese"
-
-        for key in REQUIRED_UI_TEXT_KEYS:
-            assert key in ui_text, (
-                f"Missing required UI text key: {key}"
-            )
-
-            for lang in languages:
-                assert lang in ui_text[key], (
-                    f"UI text key '{key}' missing '{lang}' translation"
-                )
-                assert isinstance(ui_text[key][lang], str), (
-                    f"UI text key '{key}' {lang} value should be a string"
-                )
-                assert len(ui_text[key][lang]) > 0, (
-                    f"UI text key '{key}' {lang} value should not be empty"
-                )
-
-    def test_zh_tw_key_replaces_chinese(self):
+        assert key in ui_text, (
+            f"Missing required UI text key: {key}"
+        )
+        assert lang in ui_text[key], (
+            f"UI text key '{key}' missing '{lang}' translation"
+        )
+        text = ui_text[key][lang]
+        assert isinstance(text, str), (
+            f"UI text key '{key}' {lang} value should be a string"
+        )
+        assert text, (
+            f"UI text key '{key}' {lang} value should not be empty"
+        )
+
+    def test_zh_tw_key_replaces_chinese(self, ui_text):
         """
         Test that 'zh-TW' key is used instead of 'chinese'.
 
         The language key was renamed from 'chinese' to 'zh-TW' for
         proper locale identification and future simplified Chinese support.
         """
-        ui_text = load_ui_text()
-
         # Check a sample of entries for zh-TW key
-        sample_keys = ["page_title", "subtitle", "task_label", "generate_btn"]
-
-        for key in sample_keys:
-            assert key in ui_text, f"Missing key: {key}"
-            assert "zh-TW" in ui_text[key], (
-                f"UI text key '{key}' should have 'zh-TW' key"
-            )
-            assert "chinese" not in ui_text[key], (
-                f"UI text key '{key}' should not have 'chinese' key (should be 'zh-TW')"
-            )
-
-    def test_vietnamese_text_uses_ascii_friendly_format(self):
+        sample_keys = frozenset({"page_title", "subtitle", "task_label", "generate_btn"})
+
+        missing = sample_keys - ui_text.keys()
+        assert not missing, f"Missing keys: {sorted(missing)}"
+
+        without_zh_tw = sorted(key for key in sample_keys if "zh-TW" not in ui_text[key])
+        stale = sorted(key for key in sample_keys if "chinese" in ui_text[key])
+        assert not without_zh_tw, (
+            f"UI text keys should have 'zh-TW' key: {without_zh_tw}"
+        )
+        assert not stale, (
+            f"UI text keys should not have 'chinese' key (should be 'zh-TW'): {stale}"
+        )
+
+    def test_vietnamese_text_uses_ascii_friendly_format(self, ui_text):
         """
         Test that Vietnamese text uses ASCII-friendly format.
 
         ColorFocus uses ASCII-friendly Vietnamese versions without diacritics
         for broader display compatibility on older systems.
         """
-        ui_text = load_ui_text()
-
         # Check that Vietnamese text is present and non-empty
         page_title_vn = ui_text["page_title"]["vietnamese"]
         assert len(page_title_vn) > 0, "Vietnamese page_title should not be empty"
@@ -165,18 +158,15 @@ class TestUITextDataLoading:
         This verifies the backend ui_text module correctly integrates
         with the Language enum from color_labels.py (now using ZH_TW).
         """
-        from backend.app.constants.ui_text import get_ui_text, UI_TEXT
-        from backend.app.constants.color_labels import Language
-
         # Test basic lookup with each language
-        for lang in Language:
-            result = get_ui_text("page_title", lang)
-            assert isinstance(result, str), (
-                f"get_ui_text should return string for {lang}"
-            )
-            assert len(result) > 0, (
-                f"get_ui_text result should not be empty for {lang}"
-            )
+        results = {lang: get_ui_text("page_title", lang) for lang in Language}
+        invalid = {
+            lang: result for lang, result in results.items()
+            if not isinstance(result, str) or not result
+        }
+        assert not invalid, (
+            f"get_ui_text should return a non-empty string for every language, got: {invalid}"
+        )
 
         # Test that UI_TEXT was loaded at module import time
         assert isinstance(UI_TEXT, dict), (
@@ -192,15 +182,13 @@ class TestUITextDataLoading:
             f"English page_title should contain 'ColorFocus', got: '{english_title}'"
         )
 
-    def test_language_descriptor_zh_tw_key(self):
+    def test_language_descriptor_zh_tw_key(self, ui_text):
         """
         Test that the language descriptor key uses 'zh-TW' suffix.
 
         The key was renamed from 'language_descriptor_chinese' to
         'language_descriptor_zh-TW'.
         """
-        ui_text = load_ui_text()
-
         # New key should exist
         assert "language_descriptor_zh-TW" in ui_text, (
             "Missing 'language_descriptor_zh-TW' key"
@@ -213,7 +201,7 @@ class TestUITextDataLoading:
 
         # The zh-TW descriptor should have all language translations
         zh_tw_descriptor = ui_text["language_descriptor_zh-TW"]
-        for lang in ["zh-TW", "english", "vietnamese", "spanish"]:
-            assert lang in zh_tw_descriptor, (
-                f"language_descriptor_zh-TW missing '{lang}' translation"
-            )
+        missing_langs = SUPPORTED_LANGUAGES_SET - zh_tw_descriptor.keys()
+        assert not missing_langs, (
+            f"language_descriptor_zh-TW missing translations: {sorted(missing_langs)}"
+        )
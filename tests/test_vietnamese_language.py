@@ -10,16 +10,13 @@ Updated for accessible color palette (2025-12-27):
 - Vietnamese labels use ASCII-friendly versions (no diacritics) for font compatibility
 """
 
-import json
 import re
-from pathlib import Path
 
-from conftest import load_puzzle_html, load_puzzle_js
+import pytest
 
+from backend.app.constants.color_labels import Language, get_color_label
+from backend.app.constants.colors import ColorToken
 
-# Paths relative to project root
-PROJECT_ROOT = Path(__file__).parent.parent
-COLOR_LABELS_JSON_PATH = PROJECT_ROOT / "shared" / "color_labels.json"
 
 # Expected Vietnamese translations - ASCII-friendly versions (no diacritics)
 # Updated for accessible color palette
@@ -34,11 +31,19 @@ EXPECTED_VIETNAMESE_LABELS = {
     "YELLOW": "Vang",
 }
 
+EXPECTED_TOKENS = frozenset(EXPECTED_VIETNAMESE_LABELS)
 
-def load_color_labels() -> dict:
-    """Load the color_labels.json file."""
-    with open(COLOR_LABELS_JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+# Language option values the dropdown must offer (zh-TW replaces chinese)
+EXPECTED_LANGUAGE_VALUES = frozenset({b"zh-TW", b"english", b"vietnamese", b"spanish"})
+
+# Captures every value="..." attribute in puzzle.html
+_VALUE_ATTR_RE = re.compile(rb'value="([^"]*)"')
+
+
+@pytest.fixture(scope="module")
+def html_option_values(puzzle_html_bytes) -> frozenset:
+    """Return every value="..." attribute value in the raw puzzle.html bytes."""
+    return frozenset(_VALUE_ATTR_RE.findall(puzzle_html_bytes))
 
 
 class TestVietnameseLanguageData:
@@ -49,24 +54,25 @@ class TestVietnameseLanguageData:
     and can be accessed through the backend Language enum.
     """
 
-    def test_color_labels_json_contains_vietnamese_key_for_all_colors(self):
+    def test_color_labels_json_contains_vietnamese_key_for_all_colors(self, color_labels):
         """
         Test that shared/color_labels.json contains vietnamese key for all 8 colors.
 
         This verifies the JSON data structure includes Vietnamese translations.
         Updated for accessible palette colors.
         """
-        color_labels = load_color_labels()
+        missing = EXPECTED_TOKENS - color_labels.keys()
+        assert not missing, f"Missing color tokens: {sorted(missing)}"
 
-        expected_tokens = {"BLACK", "BROWN", "PURPLE", "BLUE", "GRAY", "PINK", "ORANGE", "YELLOW"}
-
-        for token in expected_tokens:
-            assert token in color_labels, f"Missing color token: {token}"
-            assert "vietnamese" in color_labels[token], (
-                f"Color {token} missing 'vietnamese' key"
-            )
+        without_vietnamese = sorted(
+            token for token in EXPECTED_TOKENS if "vietnamese" not in color_labels[token]
+        )
+        assert not without_vietnamese, (
+            f"Colors missing 'vietnamese' key: {without_vietnamese}"
+        )
 
-    def test_vietnamese_labels_use_proper_utf8_encoding(self):
+    @pytest.mark.parametrize("token, expected_label", list(EXPECTED_VIETNAMESE_LABELS.items()))
+    def test_vietnamese_labels_use_proper_utf8_encoding(self, color_labels, token, expected_label):
         """
         Test that Vietnamese labels use ASCII-friendly versions for font compatibility.
 
@@ -74,14 +80,11 @@ class TestVietnameseLanguageData:
         versions without diacritical marks (Den, Nau, Tim, Xanh, Xam, Hong, Cam, Vang)
         to ensure compatibility across all fonts.
         """
-        color_labels = load_color_labels()
-
         # Test ASCII-friendly Vietnamese labels
-        for token, expected_label in EXPECTED_VIETNAMESE_LABELS.items():
-            actual_label = color_labels[token]["vietnamese"]
-            assert actual_label == expected_label, (
-                f"{token} should be '{expected_label}', got '{actual_label}'"
-            )
+        actual_label = color_labels[token]["vietnamese"]
+        assert actual_label == expected_label, (
+            f"{token} should be '{expected_label}', got '{actual_label}'"
+        )
 
     def test_backend_language_enum_includes_vietnamese(self):
         """
@@ -89,14 +92,13 @@ class TestVietnameseLanguageData:
 
         This verifies the Python backend can reference Vietnamese as a language option.
         """
-        from backend.app.constants.color_labels import Language
-
         # Check VIETNAMESE enum exists
-        assert hasattr(Language, "VIETNAMESE"), (
+        assert "VIETNAMESE" in Language.__members__, (
             "Language enum should have VIETNAMESE member"
         )
-        assert Language.VIETNAMESE.value == "vietnamese", (
-            f"Language.VIETNAMESE should have value 'vietnamese', got '{Language.VIETNAMESE.value}'"
+        vietnamese = Language["VIETNAMESE"]
+        assert vietnamese.value == "vietnamese", (
+            f"Language.VIETNAMESE should have value 'vietnamese', got '{vietnamese.value}'"
         )
 
     def test_get_color_label_works_with_vietnamese(self):
@@ -105,15 +107,11 @@ class TestVietnameseLanguageData:
 
         This verifies the full integration of Vietnamese in the backend module.
         """
-        from backend.app.constants.color_labels import Language, get_color_label
-        from backend.app.constants.colors import ColorToken
-
-        for token in ColorToken:
-            label = get_color_label(token, Language.VIETNAMESE)
-            expected = EXPECTED_VIETNAMESE_LABELS[token.value]
-            assert label == expected, (
-                f"get_color_label({token}, VIETNAMESE) expected '{expected}', got '{label}'"
-            )
+        expected = {token: EXPECTED_VIETNAMESE_LABELS[token.value] for token in ColorToken}
+        actual = {token: get_color_label(token, Language.VIETNAMESE) for token in ColorToken}
+        assert actual == expected, (
+            f"Mismatched (token, label) pairs: {sorted(actual.items() ^ expected.items())}"
+        )
 
 
 class TestLanguageSelectorUI:
@@ -124,44 +122,32 @@ class TestLanguageSelectorUI:
     elements with correct options and accessibility attributes.
     """
 
-    def test_language_dropdown_has_four_options(self):
+    def test_language_dropdown_has_four_options(self, puzzle_html_bytes, html_option_values):
         """
         Test that language dropdown renders with 4 options: zh-TW, English, Vietnamese, Spanish.
 
         This verifies the select element includes all supported languages.
         Updated: Chinese option now uses value="zh-TW" instead of "chinese".
         """
-        html_content = load_puzzle_html()
-
         # Check for select element with id="language"
-        assert 'id="language"' in html_content, (
+        assert b'id="language"' in puzzle_html_bytes, (
             "puzzle.html should have a select element with id='language'"
         )
 
         # Check for all four language options (zh-TW replaces chinese)
-        assert 'value="zh-TW"' in html_content, (
-            "Language dropdown should have zh-TW option"
-        )
-        assert 'value="english"' in html_content, (
-            "Language dropdown should have English option"
-        )
-        assert 'value="vietnamese"' in html_content, (
-            "Language dropdown should have Vietnamese option"
-        )
-        assert 'value="spanish"' in html_content, (
-            "Language dropdown should have Spanish option"
+        missing = EXPECTED_LANGUAGE_VALUES - html_option_values
+        assert not missing, (
+            f"Language dropdown missing options: {sorted(v.decode() for v in missing)}"
         )
 
-    def test_language_dropdown_has_accessibility_label(self):
+    def test_language_dropdown_has_accessibility_label(self, puzzle_html_bytes):
         """
         Test that language dropdown has proper aria-label for accessibility.
 
         This verifies the select element has the required ARIA attribute.
         """
-        html_content = load_puzzle_html()
-
         # Check for aria-label on the language select element
-        assert 'aria-label="Select display language"' in html_content, (
+        assert b'aria-label="Select display language"' in puzzle_html_bytes, (
             "Language dropdown should have aria-label='Select display language'"
         )
 
@@ -174,51 +160,45 @@ class TestLanguageSwitchingLogic:
     and event handling for language switching.
     """
 
-    def test_current_language_state_variable_exists(self):
+    def test_current_language_state_variable_exists(self, puzzle_js):
         """
         Test that currentLanguage state variable is initialized in JavaScript.
 
         This verifies the language state management is implemented.
         """
-        js_content = load_puzzle_js()
-
         # Check for currentLanguage variable initialization with localStorage fallback
-        assert "currentLanguage" in js_content, (
+        assert "currentLanguage" in puzzle_js, (
             "JavaScript should define currentLanguage variable"
         )
-        assert "localStorage.getItem('colorFocusLanguage')" in js_content, (
+        assert "localStorage.getItem('colorFocusLanguage')" in puzzle_js, (
             "JavaScript should read language preference from localStorage"
         )
 
-    def test_language_change_event_listener_exists(self):
+    def test_language_change_event_listener_exists(self, puzzle_js):
         """
         Test that language change event listener is implemented.
 
         This verifies the dropdown change triggers re-rendering.
         """
-        js_content = load_puzzle_js()
-
         # Check for event listener on language selector
-        assert "addEventListener('change'" in js_content, (
+        assert "addEventListener('change'" in puzzle_js, (
             "JavaScript should add change event listener for language switching"
         )
-        assert "localStorage.setItem('colorFocusLanguage'" in js_content, (
+        assert "localStorage.setItem('colorFocusLanguage'" in puzzle_js, (
             "JavaScript should save language preference to localStorage on change"
         )
 
-    def test_language_descriptors_defined_for_instructions(self):
+    def test_language_descriptors_defined_for_instructions(self, puzzle_js):
         """
         Test that language descriptors are available for task instructions text.
 
         This verifies the dynamic instruction text can be updated per language.
         Now uses ui_text.json instead of hardcoded LANGUAGE_DESCRIPTORS.
         """
-        js_content = load_puzzle_js()
-
         # Check for getLanguageDescriptor function that looks up from ui_text.json
-        assert "getLanguageDescriptor" in js_content, (
+        assert "getLanguageDescriptor" in puzzle_js, (
             "JavaScript should define getLanguageDescriptor function"
         )
-        assert "language_descriptor_" in js_content, (
+        assert "language_descriptor_" in puzzle_js, (
             "JavaScript should reference language_descriptor_ keys from ui_text.json"
         )